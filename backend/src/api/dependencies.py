@@ -11,12 +11,15 @@ from src.database import get_session
 from src.auth.jwt import verify_token
 
 
-def get_user_session(
+async def get_user_session(
     session: Session = Depends(get_session),
     user_id: str = Depends(verify_token)
 ) -> Tuple[Session, str]:
     """Get database session and user_id for user-scoped queries.
 
+    Declared async so FastAPI resolves it on the event loop instead of
+    offloading it to the threadpool; it does no blocking work itself.
+
     Args:
         session: Database session from T204
         user_id: User ID from JWT via T205
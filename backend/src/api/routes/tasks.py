@@ -4,7 +4,9 @@ Task: T207 - Implement Task CRUD API endpoints filtered by user_id.
 """
 
 from typing import List, Tuple
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import delete, insert, lambda_stmt, update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlmodel import Session, select
 
 from src.models import Todo
@@ -13,6 +15,17 @@ from src.api.dependencies import get_user_session
 router = APIRouter(prefix="/api", tags=["tasks"])
 
 
+def _owned_task_statement(task_id: int, user_id: str) -> StatementLambdaElement:
+    """Select a task by ID, scoped to the user who owns it.
+
+    Built with lambda_stmt so SQLAlchemy constructs the statement and its
+    cache key once; later calls only bind task_id and user_id.
+    """
+    return lambda_stmt(
+        lambda: select(Todo).where(Todo.id == task_id, Todo.user_id == user_id)
+    )
+
+
 @router.post("/{user_id}/tasks", response_model=Todo, status_code=status.HTTP_201_CREATED)
 def create_task(
     user_id: str,
@@ -22,23 +35,39 @@ def create_task(
     """Create a new task for the authenticated user."""
     session, jwt_user_id = deps
 
-    todo.user_id = jwt_user_id
-    session.add(todo)
+    values = todo.model_dump(exclude={"id"})
+    values["user_id"] = jwt_user_id
+
+    # RETURNING hands back the stored row, so the response matches later reads
+    statement = insert(Todo).values(**values).returning(Todo)
+    task = session.exec(statement).scalars().one()
+
     session.commit()
-    session.refresh(todo)
-    return todo
+    return task
 
 
 @router.get("/{user_id}/tasks", response_model=List[Todo])
 def list_tasks(
     user_id: str,
+    limit: int = Query(default=100, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
     deps: Tuple[Session, str] = Depends(get_user_session)
 ):
-    """List all tasks for the authenticated user."""
+    """List one page of tasks for the authenticated user.
+
+    Tasks are ordered by ID so pages are stable and served from the
+    (user_id, id) index. Pages default to 100 tasks and hold at most 500;
+    callers page through with offset until a short page comes back.
+    """
     session, jwt_user_id = deps
 
-    statement = select(Todo).where(Todo.user_id == jwt_user_id)
-    tasks = session.exec(statement).all()
+    statement = lambda_stmt(
+        lambda: select(Todo).where(Todo.user_id == jwt_user_id).order_by(Todo.id)
+    )
+    if offset:
+        statement += lambda s: s.offset(offset)
+    statement += lambda s: s.limit(limit)
+    tasks = session.exec(statement).scalars().all()
     return tasks
 
 
@@ -51,8 +80,7 @@ def get_task(
     """Get a specific task by ID. Returns 404 if not found or not owned by user."""
     session, jwt_user_id = deps
 
-    statement = select(Todo).where(Todo.id == task_id, Todo.user_id == jwt_user_id)
-    task = session.exec(statement).first()
+    task = session.exec(_owned_task_statement(task_id, jwt_user_id)).scalars().first()
 
     if not task:
         raise HTTPException(
@@ -73,8 +101,17 @@ def update_task(
     """Update a task. Returns 404 if not found or not owned by user."""
     session, jwt_user_id = deps
 
-    statement = select(Todo).where(Todo.id == task_id, Todo.user_id == jwt_user_id)
-    task = session.exec(statement).first()
+    statement = (
+        update(Todo)
+        .where(Todo.id == task_id, Todo.user_id == jwt_user_id)
+        .values(
+            title=updated_task.title,
+            description=updated_task.description,
+            completed=updated_task.completed,
+        )
+        .returning(Todo)
+    )
+    task = session.exec(statement).scalars().first()
 
     if not task:
         raise HTTPException(
@@ -82,13 +119,7 @@ def update_task(
             detail="Task not found"
         )
 
-    task.title = updated_task.title
-    task.description = updated_task.description
-    task.completed = updated_task.completed
-
-    session.add(task)
     session.commit()
-    session.refresh(task)
     return task
 
 
@@ -101,8 +132,13 @@ def complete_task(
     """Mark a task as complete. Returns 404 if not found or not owned by user."""
     session, jwt_user_id = deps
 
-    statement = select(Todo).where(Todo.id == task_id, Todo.user_id == jwt_user_id)
-    task = session.exec(statement).first()
+    statement = (
+        update(Todo)
+        .where(Todo.id == task_id, Todo.user_id == jwt_user_id)
+        .values(completed=True)
+        .returning(Todo)
+    )
+    task = session.exec(statement).scalars().first()
 
     if not task:
         raise HTTPException(
@@ -110,11 +146,7 @@ def complete_task(
             detail="Task not found"
         )
 
-    task.completed = True
-
-    session.add(task)
     session.commit()
-    session.refresh(task)
     return task
 
 
@@ -127,14 +159,17 @@ def delete_task(
     """Delete a task. Returns 404 if not found or not owned by user."""
     session, jwt_user_id = deps
 
-    statement = select(Todo).where(Todo.id == task_id, Todo.user_id == jwt_user_id)
-    task = session.exec(statement).first()
+    statement = (
+        delete(Todo)
+        .where(Todo.id == task_id, Todo.user_id == jwt_user_id)
+        .returning(Todo.id)
+    )
+    deleted_id = session.exec(statement).scalars().first()
 
-    if not task:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    session.delete(task)
     session.commit()
@@ -6,13 +6,24 @@ DB_PATH = os.path.join(BASE_DIR, "todoapp.db")
 
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# SQL logging formats every statement; only enable it when debugging.
+DATABASE_ECHO = os.getenv("DATABASE_ECHO", "false").lower() == "true"
+
+# Pooled connections are reused across requests instead of reopened.
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
+    echo=DATABASE_ECHO,
+    pool_size=DATABASE_POOL_SIZE,
+    max_overflow=DATABASE_MAX_OVERFLOW,
     connect_args={"check_same_thread": False},
 )
 
 def get_session():
-    with Session(engine) as session:
+    # Routes return ORM objects straight after commit; keep them loaded so
+    # serialization does not trigger a refresh SELECT.
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
@@ -6,6 +6,7 @@ Task: T202 - Create Todo SQLModel with user isolation via user_id from JWT.
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -13,8 +14,12 @@ class Todo(SQLModel, table=True):
     """Todo model for multi-user todo application.
 
     T202: Todo items are isolated by user_id (string from JWT).
+    Every query filters on user_id (and usually id), so both are covered
+    by a composite index.
     """
 
+    __table_args__ = (Index("ix_todo_user_id_id", "user_id", "id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str
     title: str
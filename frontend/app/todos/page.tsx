@@ -11,6 +11,9 @@ import { useRouter } from "next/navigation";
 import { useSession } from "@/lib/auth-client";
 import { apiCall } from "@/lib/api";
 
+// Tasks are listed in pages; the backend caps each page at 500.
+const PAGE_SIZE = 100;
+
 interface Todo {
   id: number;
   user_id: string;
@@ -50,7 +53,14 @@ export default function TodosPage() {
     try {
       setLoading(true);
       const userId = session?.user?.id;
-      const data = await apiCall<Todo[]>(`/api/${userId}/tasks`);
+      const data: Todo[] = [];
+      for (let offset = 0; ; offset += PAGE_SIZE) {
+        const page = await apiCall<Todo[]>(
+          `/api/${userId}/tasks?limit=${PAGE_SIZE}&offset=${offset}`
+        );
+        data.push(...page);
+        if (page.length < PAGE_SIZE) break;
+      }
       setTodos(data);
     } catch (error) {
       console.error("Failed to fetch todos:", error);